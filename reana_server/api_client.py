@@ -7,14 +7,42 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """REST API client generator."""
-from functools import partial
+from functools import lru_cache, partial
 
 from reana_commons.api_client import get_current_api_client
+from reana_commons.k8s.api_client import create_api_client
 from reana_commons.publisher import WorkflowSubmissionPublisher
 from werkzeug.local import LocalProxy
 
-current_rwc_api_client = LocalProxy(
-    partial(get_current_api_client, component="reana-workflow-controller")
-)
+
+@lru_cache(maxsize=None)
+def _get_rwc_api_client():
+    """Return the REANA-Workflow-Controller API client.
+
+    Creating the client loads and parses its OpenAPI specification from disk, so
+    it is created only once instead of every time the proxy is accessed.
+    """
+    return get_current_api_client(component="reana-workflow-controller")
+
+
+current_rwc_api_client = LocalProxy(_get_rwc_api_client)
 
 current_workflow_submission_publisher = LocalProxy(WorkflowSubmissionPublisher)
+
+
+@lru_cache(maxsize=None)
+def _get_k8s_api_client(api):
+    """Return the Kubernetes API client of the given type.
+
+    Each client has its own pool of connections to the Kubernetes API server, so
+    clients are created only once and reused by all the requests. The in-cluster
+    configuration refreshes the service account token of existing clients.
+    """
+    return create_api_client(api=api)
+
+
+current_k8s_corev1_api_client = LocalProxy(partial(_get_k8s_api_client, "CoreV1"))
+
+current_k8s_custom_objects_api_client = LocalProxy(
+    partial(_get_k8s_api_client, "CustomObjectsApi")
+)
@@ -144,6 +144,9 @@ REANA_WORKFLOW_SCHEDULING_READINESS_CHECK_VALUE = (
 )
 """REANA workflow scheduling readiness check value."""
 
+REANA_STATUS_CACHE_TTL = int(os.getenv("REANA_STATUS_CACHE_TTL", 5))
+"""Number of seconds during which the cluster health status is served from cache. Set to ``0`` to disable caching."""
+
 SUPPORTED_COMPUTE_BACKENDS = json.loads(os.getenv("REANA_COMPUTE_BACKENDS", "[]")) or []
 """List of supported compute backends."""
 
@@ -395,7 +398,7 @@ REGEX_CHARS_TO_REPLACE = re.compile("[^a-zA-Z0-9_]+")
 FETCHER_MAXIMUM_FILE_SIZE = 1024**3  # 1 GB
 """Maximum file size allowed when fetching workflow specifications."""
 
-FETCHER_ALLOWED_SCHEMES = ["https", "http"]
+FETCHER_ALLOWED_SCHEMES = {"https", "http"}
 """Schemes allowed when fetching workflow specifications."""
 
 FETCHER_REQUEST_TIMEOUT = 60
@@ -406,12 +409,12 @@ if REANA_GITLAB_HOST:
     FETCHER_ALLOWED_GITLAB_HOSTNAMES.add(REANA_GITLAB_HOST)
 """GitLab instances allowed when fetching workflow specifications."""
 
-LAUNCHER_ALLOWED_SNAKEMAKE_URLS = [
+LAUNCHER_ALLOWED_SNAKEMAKE_URLS = {
     "https://github.com/reanahub/reana-demo-cms-h4l",
     "https://github.com/reanahub/reana-demo-helloworld",
     "https://github.com/reanahub/reana-demo-root6-roofit",
     "https://github.com/reanahub/reana-demo-worldpopulation",
-]
+}
 """Allowed URLs when launching a Snakemake workflow."""
 
 # Workspace retention rules
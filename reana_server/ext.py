@@ -113,6 +113,8 @@ class REANA(object):
         for k in dir(config):
             if k.startswith("REANA_"):
                 app.config.setdefault(k, getattr(config, k))
+        # API responses are read by programs, so there is no need to sort their keys
+        app.json.sort_keys = False
 
     def init_error_handlers(self, app):
         """Initialize custom error handlers."""
@@ -45,6 +45,8 @@ def create_minimal_app(config_mapping=None):
     app.config.from_object("reana_server.config")
     if config_mapping:
         app.config.from_mapping(config_mapping)
+    # keep the JSON responses identical to the ones of the REANA extension
+    app.json.sort_keys = False
 
     app.session = Session
 
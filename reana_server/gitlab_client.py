@@ -5,6 +5,7 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 """REANA-Server GitLab client."""
 
+from http.cookiejar import DefaultCookiePolicy
 from typing import Dict, Optional, Union
 from urllib.parse import quote_plus
 import requests
@@ -15,6 +16,13 @@ from reana_commons.k8s.secrets import UserSecretsStore
 from reana_server.config import REANA_GITLAB_HOST
 
 
+gitlab_session = requests.Session()
+"""HTTP session shared by GitLab clients, so that connections to GitLab are reused."""
+
+# the session is shared by the clients of all users, so it must not keep cookies
+gitlab_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+
 class GitLabClientException(Exception):
     """Base class for GitLab exceptions."""
 
@@ -79,12 +87,13 @@ class GitLabClient:
 
         :param host: GitLab host (default: REANA_GITLAB_HOST)
         :param access_token: GitLab access token (default: unauthenticated)
-        :param http_request: Function to make HTTP requests (default: requests.request).
+        :param http_request: Function to make HTTP requests
+            (default: ``gitlab_session.request``).
         """
         self.access_token = access_token
         self.host = host
         self._http_request = (
-            http_request if http_request is not None else requests.request
+            http_request if http_request is not None else gitlab_session.request
         )
 
     def _make_url(self, path: str, **kwargs: Dict[str, str]):
@@ -465,7 +465,7 @@ def list_quota_usage(
 ):
     """List quota usage of users."""
     try:
-        response = _get_users(id, email, user_access_token)
+        response = _get_users(id, email, user_access_token, with_quota_resources=True)
         headers = ["id", "email", "cpu-used", "cpu-limit", "disk-used", "disk-limit"]
         health_order = {
             QuotaHealth.healthy.name: 0,
@@ -566,42 +566,47 @@ def set_quota_limit(
 ):
     """Set quota limits to the given users per resource."""
     try:
+        # The resource does not depend on the user, so it is checked only once,
+        # before looking up any user
+        resource = None
+        if resource_name:
+            resource = Resource.query.filter_by(name=resource_name).one_or_none()
+        elif resource_type in ResourceType._member_names_:
+            resources = Resource.query.filter_by(type_=resource_type).all()
+            if resources and len(resources) > 1:
+                click.secho(
+                    f"ERROR: There are more than one `{resource_type}` resource. "
+                    "Please provide resource name with `--resource-name` option to specify the exact resource.",
+                    fg="red",
+                    err=True,
+                )
+                sys.exit(1)
+            elif resources:
+                resource = resources[0]
+
+        if not resource:
+            resources = [
+                f"{resource.type_.name} ({resource.name})"
+                for resource in Resource.query
+            ]
+            error_msg = (
+                f"ERROR: Provided resource `{resource_name or resource_type}` does not exist. "
+                if resource_name or resource_type
+                else "ERROR: Please provide a resource. "
+            )
+            error_msg += f"Available resources are: {', '.join(resources)}."
+            click.secho(
+                error_msg,
+                fg="red",
+                err=True,
+            )
+            sys.exit(1)
+
         for email in emails:
-            error_msg = None
-            resource = None
             user = _get_user_by_criteria(None, email)
-
-            if resource_name:
-                resource = Resource.query.filter_by(name=resource_name).one_or_none()
-            elif resource_type in ResourceType._member_names_:
-                resources = Resource.query.filter_by(type_=resource_type).all()
-                if resources and len(resources) > 1:
-                    click.secho(
-                        f"ERROR: There are more than one `{resource_type}` resource. "
-                        "Please provide resource name with `--resource-name` option to specify the exact resource.",
-                        fg="red",
-                        err=True,
-                    )
-                    sys.exit(1)
-                else:
-                    resource = resources[0]
-
             if not user:
-                error_msg = f"ERROR: Provided user {email} does not exist."
-            elif not resource:
-                resources = [
-                    f"{resource.type_.name} ({resource.name})"
-                    for resource in Resource.query
-                ]
-                error_msg = (
-                    f"ERROR: Provided resource `{resource_name or resource_type}` does not exist. "
-                    if resource_name or resource_type
-                    else "ERROR: Please provide a resource. "
-                )
-                error_msg += f"Available resources are: {', '.join(resources)}."
-            if error_msg:
                 click.secho(
-                    error_msg,
+                    f"ERROR: Provided user {email} does not exist.",
                     fg="red",
                     err=True,
                 )
@@ -8,11 +8,12 @@
 
 """REANA Server info functionality Flask-Blueprint."""
 
+import hashlib
+import json
 import logging
-import traceback
-from importlib.metadata import version
+from importlib.metadata import PackageNotFoundError, version
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, request
 from marshmallow import Schema, fields
 
 from reana_commons.config import DEFAULT_WORKSPACE_PATH, WORKSPACE_PATHS
@@ -59,10 +60,22 @@ def info(user, **kwargs):  # noqa
           description: The API access_token of workflow owner.
           required: true
           type: string
+        - name: If-None-Match
+          in: header
+          description: >-
+            Optional. ETag of a previously received response, to only get the
+            cluster information if it has changed.
+          required: false
+          type: string
       responses:
         200:
           description: >-
             Request succeeded. The response contains general info about the cluster.
+          headers:
+            ETag:
+              type: string
+            Cache-Control:
+              type: string
           schema:
             properties:
               compute_backends:
@@ -173,6 +186,7 @@ def info(user, **kwargs):  # noqa
                     type: string
                   value:
                     type: string
+                    x-nullable: true
                 type: object
               yadage_engine_version:
                 properties:
@@ -180,6 +194,7 @@ def info(user, **kwargs):  # noqa
                     type: string
                   value:
                     type: string
+                    x-nullable: true
                 type: object
               yadage_engine_adage_version:
                 properties:
@@ -187,6 +202,7 @@ def info(user, **kwargs):  # noqa
                     type: string
                   value:
                     type: string
+                    x-nullable: true
                 type: object
               yadage_engine_packtivity_version:
                 properties:
@@ -194,6 +210,7 @@ def info(user, **kwargs):  # noqa
                     type: string
                   value:
                     type: string
+                    x-nullable: true
                 type: object
               snakemake_engine_version:
                 properties:
@@ -201,6 +218,7 @@ def info(user, **kwargs):  # noqa
                     type: string
                   value:
                     type: string
+                    x-nullable: true
                 type: object
               dask_enabled:
                 properties:
@@ -364,6 +382,15 @@ def info(user, **kwargs):  # noqa
                     "value": "20"
                 },
               }
+        304:
+          description: >-
+            Request succeeded. The cluster information has not changed since the
+            response with the ETag given in If-None-Match.
+          headers:
+            ETag:
+              type: string
+            Cache-Control:
+              type: string
         500:
           description: >-
             Request failed. Internal controller error.
@@ -378,114 +405,134 @@ def info(user, **kwargs):  # noqa
                 "message": "Internal controller error."
               }
     """
-    try:
-        cluster_information = dict(
-            workspaces_available=dict(
-                title="List of available workspaces",
-                value=list(WORKSPACE_PATHS.values()),
-            ),
-            default_workspace=dict(
-                title="Default workspace", value=DEFAULT_WORKSPACE_PATH
-            ),
-            compute_backends=dict(
-                title="List of supported compute backends",
-                value=SUPPORTED_COMPUTE_BACKENDS,
-            ),
-            default_kubernetes_memory_limit=dict(
-                title="Default memory limit for Kubernetes jobs",
-                value=REANA_KUBERNETES_JOBS_MEMORY_LIMIT,
-            ),
-            kubernetes_max_memory_limit=dict(
-                title="Maximum allowed memory limit for Kubernetes jobs",
-                value=REANA_KUBERNETES_JOBS_MAX_USER_MEMORY_LIMIT,
-            ),
-            maximum_workspace_retention_period=dict(
-                title="Maximum retention period in days for workspace files",
-                value=WORKSPACE_RETENTION_PERIOD,
-            ),
-            default_kubernetes_jobs_timeout=dict(
-                title="Default timeout for Kubernetes jobs",
-                value=REANA_KUBERNETES_JOBS_TIMEOUT_LIMIT,
-            ),
-            maximum_kubernetes_jobs_timeout=dict(
-                title="Maximum timeout for Kubernetes jobs",
-                value=REANA_KUBERNETES_JOBS_MAX_USER_TIMEOUT_LIMIT,
-            ),
-            maximum_interactive_session_inactivity_period=dict(
-                title="Maximum inactivity period in days before automatic closure of interactive sessions",
-                value=REANA_INTERACTIVE_SESSION_MAX_INACTIVITY_PERIOD,
-            ),
-            interactive_sessions_custom_image_allowed=dict(
-                title="Users can set custom interactive session images",
-                value=REANA_INTERACTIVE_SESSIONS_ENVIRONMENTS_CUSTOM_ALLOWED,
-            ),
-            interactive_session_recommended_jupyter_images=dict(
-                title="Recommended Jupyter images for interactive sessions",
-                value=[
-                    item["image"]
-                    for item in REANA_INTERACTIVE_SESSIONS_ENVIRONMENTS["jupyter"][
-                        "recommended"
-                    ]
-                ],
-            ),
-            supported_workflow_engines=dict(
-                title="List of supported workflow engines",
-                value=["cwl", "serial", "snakemake", "yadage"],
-            ),
-            cwl_engine_tool=dict(title="CWL engine tool", value="cwltool"),
-            cwl_engine_version=dict(
-                title="CWL engine version", value=version("cwltool")
-            ),
-            yadage_engine_version=dict(
-                title="Yadage engine version", value=version("yadage")
-            ),
-            yadage_engine_adage_version=dict(
-                title="Yadage engine adage version", value=version("adage")
-            ),
-            yadage_engine_packtivity_version=dict(
-                title="Yadage engine packtivity version", value=version("packtivity")
-            ),
-            snakemake_engine_version=dict(
-                title="Snakemake engine version",
-                value=version("snakemake"),
-            ),
-            dask_enabled=dict(
-                title="Dask workflows allowed in the cluster",
-                value=bool(DASK_ENABLED),
-            ),
-        )
+    response = Response(CLUSTER_INFORMATION_JSON, mimetype="application/json")
+    response.set_etag(CLUSTER_INFORMATION_ETAG)
+    # clients have to revalidate, but unchanged information is not sent again
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 
-        if DASK_ENABLED:
-            cluster_information["dask_autoscaler_enabled"] = dict(
-                title="Dask autoscaler enabled in the cluster",
-                value=bool(DASK_AUTOSCALER_ENABLED),
-            )
-            cluster_information["dask_cluster_default_number_of_workers"] = dict(
-                title="The number of Dask workers created by default",
-                value=REANA_DASK_CLUSTER_DEFAULT_NUMBER_OF_WORKERS,
-            )
-            cluster_information["dask_cluster_max_memory_limit"] = dict(
-                title="The maximum memory limit for Dask clusters created by users",
-                value=REANA_DASK_CLUSTER_MAX_MEMORY_LIMIT,
-            )
-            cluster_information["dask_cluster_default_single_worker_memory"] = dict(
-                title="The amount of memory used by default by a single Dask worker",
-                value=REANA_DASK_CLUSTER_DEFAULT_SINGLE_WORKER_MEMORY,
-            )
-            cluster_information["dask_cluster_max_single_worker_memory"] = dict(
-                title="The maximum amount of memory that users can ask for the single Dask worker",
-                value=REANA_DASK_CLUSTER_MAX_SINGLE_WORKER_MEMORY,
-            )
-            cluster_information["dask_cluster_max_number_of_workers"] = dict(
-                title="The maximum number of workers that users can ask for the single Dask cluster",
-                value=REANA_DASK_CLUSTER_MAX_NUMBER_OF_WORKERS,
-            )
+def _get_cluster_information():
+    """Collect the cluster capabilities from the REANA configuration."""
+    cluster_information = dict(
+        workspaces_available=dict(
+            title="List of available workspaces",
+            value=list(WORKSPACE_PATHS.values()),
+        ),
+        default_workspace=dict(title="Default workspace", value=DEFAULT_WORKSPACE_PATH),
+        compute_backends=dict(
+            title="List of supported compute backends",
+            value=SUPPORTED_COMPUTE_BACKENDS,
+        ),
+        default_kubernetes_memory_limit=dict(
+            title="Default memory limit for Kubernetes jobs",
+            value=REANA_KUBERNETES_JOBS_MEMORY_LIMIT,
+        ),
+        kubernetes_max_memory_limit=dict(
+            title="Maximum allowed memory limit for Kubernetes jobs",
+            value=REANA_KUBERNETES_JOBS_MAX_USER_MEMORY_LIMIT,
+        ),
+        maximum_workspace_retention_period=dict(
+            title="Maximum retention period in days for workspace files",
+            value=WORKSPACE_RETENTION_PERIOD,
+        ),
+        default_kubernetes_jobs_timeout=dict(
+            title="Default timeout for Kubernetes jobs",
+            value=REANA_KUBERNETES_JOBS_TIMEOUT_LIMIT,
+        ),
+        maximum_kubernetes_jobs_timeout=dict(
+            title="Maximum timeout for Kubernetes jobs",
+            value=REANA_KUBERNETES_JOBS_MAX_USER_TIMEOUT_LIMIT,
+        ),
+        maximum_interactive_session_inactivity_period=dict(
+            title="Maximum inactivity period in days before automatic closure of interactive sessions",
+            value=REANA_INTERACTIVE_SESSION_MAX_INACTIVITY_PERIOD,
+        ),
+        interactive_sessions_custom_image_allowed=dict(
+            title="Users can set custom interactive session images",
+            value=REANA_INTERACTIVE_SESSIONS_ENVIRONMENTS_CUSTOM_ALLOWED,
+        ),
+        interactive_session_recommended_jupyter_images=dict(
+            title="Recommended Jupyter images for interactive sessions",
+            value=[
+                item["image"]
+                for item in REANA_INTERACTIVE_SESSIONS_ENVIRONMENTS.get(
+                    "jupyter", {}
+                ).get("recommended", [])
+            ],
+        ),
+        supported_workflow_engines=dict(
+            title="List of supported workflow engines",
+            value=["cwl", "serial", "snakemake", "yadage"],
+        ),
+        cwl_engine_tool=dict(title="CWL engine tool", value="cwltool"),
+        cwl_engine_version=dict(
+            title="CWL engine version", value=_get_package_version("cwltool")
+        ),
+        yadage_engine_version=dict(
+            title="Yadage engine version", value=_get_package_version("yadage")
+        ),
+        yadage_engine_adage_version=dict(
+            title="Yadage engine adage version", value=_get_package_version("adage")
+        ),
+        yadage_engine_packtivity_version=dict(
+            title="Yadage engine packtivity version",
+            value=_get_package_version("packtivity"),
+        ),
+        snakemake_engine_version=dict(
+            title="Snakemake engine version",
+            value=_get_package_version("snakemake"),
+        ),
+        dask_enabled=dict(
+            title="Dask workflows allowed in the cluster",
+            value=bool(DASK_ENABLED),
+        ),
+    )
+
+    if DASK_ENABLED:
+        cluster_information.update(_get_dask_cluster_information())
 
-        return InfoSchema().dump(cluster_information)
+    return cluster_information
 
-    except Exception as e:
-        logging.error(traceback.format_exc())
-        return jsonify({"message": str(e)}), 500
+
+def _get_package_version(package):
+    """Return the installed version of ``package`` or ``None`` if not installed."""
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        logging.warning("Could not determine the version of %s.", package)
+        return None
+
+
+def _get_dask_cluster_information():
+    """Collect the Dask cluster capabilities from the REANA configuration."""
+    return dict(
+        dask_autoscaler_enabled=dict(
+            title="Dask autoscaler enabled in the cluster",
+            value=bool(DASK_AUTOSCALER_ENABLED),
+        ),
+        dask_cluster_default_number_of_workers=dict(
+            title="The number of Dask workers created by default",
+            value=REANA_DASK_CLUSTER_DEFAULT_NUMBER_OF_WORKERS,
+        ),
+        dask_cluster_max_memory_limit=dict(
+            title="The maximum memory limit for Dask clusters created by users",
+            value=REANA_DASK_CLUSTER_MAX_MEMORY_LIMIT,
+        ),
+        dask_cluster_default_single_worker_memory=dict(
+            title="The amount of memory used by default by a single Dask worker",
+            value=REANA_DASK_CLUSTER_DEFAULT_SINGLE_WORKER_MEMORY,
+        ),
+        dask_cluster_max_single_worker_memory=dict(
+            title="The maximum amount of memory that users can ask for the single Dask worker",
+            value=REANA_DASK_CLUSTER_MAX_SINGLE_WORKER_MEMORY,
+        ),
+        dask_cluster_max_number_of_workers=dict(
+            title="The maximum number of workers that users can ask for the single Dask cluster",
+            value=REANA_DASK_CLUSTER_MAX_NUMBER_OF_WORKERS,
+        ),
+    )
 
 
 class ListStringInfoValue(Schema):
@@ -523,21 +570,28 @@ class InfoSchema(Schema):
     maximum_interactive_session_inactivity_period = fields.Nested(
         StringNullableInfoValue
     )
-    kubernetes_max_memory_limit = fields.Nested(StringInfoValue)
     interactive_session_recommended_jupyter_images = fields.Nested(ListStringInfoValue)
     interactive_sessions_custom_image_allowed = fields.Nested(StringInfoValue)
     supported_workflow_engines = fields.Nested(ListStringInfoValue)
     cwl_engine_tool = fields.Nested(StringInfoValue)
-    cwl_engine_version = fields.Nested(StringInfoValue)
-    yadage_engine_version = fields.Nested(StringInfoValue)
-    yadage_engine_adage_version = fields.Nested(StringInfoValue)
-    yadage_engine_packtivity_version = fields.Nested(StringInfoValue)
-    snakemake_engine_version = fields.Nested(StringInfoValue)
+    cwl_engine_version = fields.Nested(StringNullableInfoValue)
+    yadage_engine_version = fields.Nested(StringNullableInfoValue)
+    yadage_engine_adage_version = fields.Nested(StringNullableInfoValue)
+    yadage_engine_packtivity_version = fields.Nested(StringNullableInfoValue)
+    snakemake_engine_version = fields.Nested(StringNullableInfoValue)
     dask_enabled = fields.Nested(StringInfoValue)
-    if DASK_ENABLED:
-        dask_autoscaler_enabled = fields.Nested(StringInfoValue)
-        dask_cluster_default_number_of_workers = fields.Nested(StringInfoValue)
-        dask_cluster_max_memory_limit = fields.Nested(StringInfoValue)
-        dask_cluster_default_single_worker_memory = fields.Nested(StringInfoValue)
-        dask_cluster_max_single_worker_memory = fields.Nested(StringInfoValue)
-        dask_cluster_max_number_of_workers = fields.Nested(StringInfoValue)
+    # Dask fields are only present when Dask is enabled in the cluster
+    dask_autoscaler_enabled = fields.Nested(StringInfoValue)
+    dask_cluster_default_number_of_workers = fields.Nested(StringInfoValue)
+    dask_cluster_max_memory_limit = fields.Nested(StringInfoValue)
+    dask_cluster_default_single_worker_memory = fields.Nested(StringInfoValue)
+    dask_cluster_max_single_worker_memory = fields.Nested(StringInfoValue)
+    dask_cluster_max_number_of_workers = fields.Nested(StringInfoValue)
+
+
+# The cluster capabilities only depend on the deployment configuration, so they
+# are collected and serialised once when the module is imported.
+CLUSTER_INFORMATION_JSON = json.dumps(
+    InfoSchema().dump(_get_cluster_information()).data, sort_keys=True
+).encode()
+CLUSTER_INFORMATION_ETAG = hashlib.sha256(CLUSTER_INFORMATION_JSON).hexdigest()
@@ -8,21 +8,23 @@
 
 import json
 import logging
-import os
-import shutil
 import threading
 import traceback
+from contextlib import nullcontext
 
 from bravado.exception import HTTPError
 from flask import Blueprint, jsonify
 from jsonschema import ValidationError
-from marshmallow import Schema
+from marshmallow import Schema, ValidationError as ArgsValidationError
 from webargs import fields
 from webargs.flaskparser import use_kwargs
 import yaml
 
 from reana_commons.errors import REANAValidationError, REANAQuotaExceededError
-from reana_commons.specification import load_reana_spec
+from reana_commons.specification import (
+    load_input_parameters,
+    load_workflow_spec_from_reana_yaml,
+)
 from reana_commons.validation.utils import validate_workflow_name
 from reana_db.utils import (
     _get_workflow_with_uuid_or_name,
@@ -40,16 +42,35 @@ from reana_server.utils import (
     mv_workflow_files,
     prevent_disk_quota_excess,
     publish_workflow_submission,
+    remove_fetched_workflows_dir,
     filter_input_files,
     get_workspace_retention_rules,
 )
 from reana_server.validation import validate_workflow
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 blueprint = Blueprint("launch", __name__)
 
 load_reana_spec_lock = threading.Lock()
-"""Lock used to make sure only one specification is loaded at a time."""
+"""Lock used to make sure only one Snakemake specification is loaded at a time."""
+
+
+class JSONObjectField(fields.Field):
+    """Field that deserialises a JSON string into a dictionary."""
+
+    def _deserialize(self, value, attr, data):
+        try:
+            value = json.loads(value)
+        except (TypeError, json.JSONDecodeError):
+            raise ArgsValidationError("Not a valid JSON string.")
+        if not isinstance(value, dict):
+            raise ArgsValidationError("Not a valid JSON object.")
+        return value
 
 
 @blueprint.route("/launch", methods=["POST"])
@@ -57,13 +78,13 @@ load_reana_spec_lock = threading.Lock()
     {
         "url": fields.Url(schemes=FETCHER_ALLOWED_SCHEMES, required=True),
         "name": fields.Str(),
-        "parameters": fields.Str(),
+        "parameters": JSONObjectField(),
         "specification": fields.Str(),
     }
 )
 @signin_required()
 @check_quota
-def launch(user, url, name="", parameters="{}", specification=None):
+def launch(user, url, name="", parameters=None, specification=None):
     r"""Endpoint to launch a REANA workflow from URL.
 
     ---
@@ -163,37 +184,46 @@ def launch(user, url, name="", parameters="{}", specification=None):
         user_id = str(user.id_)
         tmpdir = get_fetched_workflows_dir(user_id)
 
+        # Validate the name given by the user before fetching the workflow
+        workflow_name = name.replace(" ", "")
+        if workflow_name:
+            validate_workflow_name(workflow_name)
+
         # Fetch the workflow spec
         fetcher = get_fetcher(url, tmpdir, specification)
         fetcher.fetch()
 
         # Generate the workflow name
-        workflow_name = name.replace(" ", "") or fetcher.generate_workflow_name()
-        validate_workflow_name(workflow_name)
+        if not workflow_name:
+            workflow_name = fetcher.generate_workflow_name()
+            validate_workflow_name(workflow_name)
 
         # Load and validate the workflow spec
         spec_path = fetcher.workflow_spec_path()
 
+        with open(spec_path) as spec_fd:
+            reana_yaml = yaml.load(spec_fd, Loader=SafeLoader)
+
         # When launching a snakemake workflow, check if the url is allowed
         # FIXME: This will not be needed when using a sandbox
-        with open(spec_path) as spec_fd:
-            reana_yaml = yaml.safe_load(spec_fd.read())
-            workflow_type = reana_yaml["workflow"]["type"]
-            if (
-                workflow_type == "snakemake"
-                and url not in LAUNCHER_ALLOWED_SNAKEMAKE_URLS
-            ):
-                raise ValidationError(
-                    "Unfortunately, it is not possible to launch generic Snakemake "
-                    "workflows at the moment. Please contact the REANA admins for "
-                    "more information."
-                )
+        workflow_type = reana_yaml["workflow"]["type"]
+        if workflow_type == "snakemake" and url not in LAUNCHER_ALLOWED_SNAKEMAKE_URLS:
+            raise ValidationError(
+                "Unfortunately, it is not possible to launch generic Snakemake "
+                "workflows at the moment. Please contact the REANA admins for "
+                "more information."
+            )
 
         # FIXME: locking will not be needed when the loading and validation of
-        # specifications will be done inside an external sandbox
-        with load_reana_spec_lock:
-            reana_yaml = load_reana_spec(spec_path, workspace_path=tmpdir)
-        input_parameters = json.loads(parameters)
+        # specifications will be done inside an external sandbox. Only the
+        # Snakemake loader changes the cwd, so other workflow types are loaded
+        # concurrently.
+        spec_lock = (
+            load_reana_spec_lock if workflow_type == "snakemake" else nullcontext()
+        )
+        with spec_lock:
+            _load_workflow_specification(reana_yaml, workspace_path=tmpdir)
+        input_parameters = parameters or {}
         validation_warnings = validate_workflow(reana_yaml, input_parameters)
 
         # Keep only files and directories listed as workflow's inputs
@@ -230,8 +260,9 @@ def launch(user, url, name="", parameters="{}", specification=None):
         update_users_disk_quota(user, bytes_to_sum=disk_usage)
 
         # Start the workflow
-        parameters = {"input_parameters": input_parameters}
-        publish_workflow_submission(workflow, user.id_, parameters)
+        publish_workflow_submission(
+            workflow, user.id_, {"input_parameters": input_parameters}
+        )
         response_data = {
             "workflow_id": workflow.id_,
             "workflow_name": workflow.name,
@@ -242,18 +273,16 @@ def launch(user, url, name="", parameters="{}", specification=None):
                 "The workflow has been successfully submitted, but some warnings were issued."
             )
             response_data["validation_warnings"] = validation_warnings
-        return LaunchSchema().dump(response_data)
+        return launch_schema.dump(response_data)
     except HTTPError as e:
-        logging.error(traceback.format_exc())
+        if e.response.status_code >= 500:
+            logging.error(traceback.format_exc())
+        else:
+            logging.info("Workflow launch rejected: %s", e)
         return jsonify(e.response.json()), e.response.status_code
-    except json.JSONDecodeError:
-        logging.error(traceback.format_exc())
-        return (
-            jsonify({"message": "The workflow 'parameters' field is not valid JSON."}),
-            400,
-        )
+    # Invalid user input is expected, so there is no need to log its traceback
     except REANAQuotaExceededError as e:
-        logging.error(traceback.format_exc())
+        logging.info("Workflow launch rejected: %s", e)
         return jsonify({"message": str(e)}), 403
     except (
         REANAFetcherError,
@@ -261,7 +290,7 @@ def launch(user, url, name="", parameters="{}", specification=None):
         ValueError,
         ValidationError,
     ) as e:
-        logging.error(traceback.format_exc())
+        logging.info("Workflow launch rejected: %s", e)
         return jsonify({"message": str(e)}), 400
     except Exception:
         logging.error(traceback.format_exc())
@@ -270,18 +299,24 @@ def launch(user, url, name="", parameters="{}", specification=None):
             500,
         )
     finally:
-        # FIXME: `load_reana_spec` is not thread-safe and it changes the cwd, so for the
-        # time being we can only delete the files inside the directory where the
-        # workflow is fetched.  Deleting the directory would result in a
-        # `FileNotFoundError` when calling `os.getcwd()`, due to the cwd not existing
-        # anymore.
-        #
-        # remove_fetched_workflows_dir(tmpdir)
-        for entry in os.scandir(tmpdir):
-            if entry.is_file() or entry.is_symlink():
-                os.remove(entry)
-            else:
-                shutil.rmtree(entry)
+        # The Snakemake loader, the only one changing the cwd, restores it before
+        # `load_reana_spec_lock` is released, so the whole directory can be removed.
+        remove_fetched_workflows_dir(tmpdir)
+
+
+def _load_workflow_specification(reana_yaml, workspace_path):
+    """Load the workflow specification and inputs of a parsed REANA specification.
+
+    This completes ``reana_yaml`` in place in the same way as
+    ``reana_commons.specification.load_reana_spec``, without parsing the
+    REANA specification file again.
+    """
+    reana_yaml["workflow"]["specification"] = load_workflow_spec_from_reana_yaml(
+        reana_yaml, workspace_path
+    )
+    input_parameters = load_input_parameters(reana_yaml, workspace_path)
+    if input_parameters is not None:
+        reana_yaml["inputs"]["parameters"] = input_parameters
 
 
 class LaunchSchema(Schema):
@@ -291,3 +326,7 @@ class LaunchSchema(Schema):
     workflow_name = fields.Str()
     message = fields.Str()
     validation_warnings = fields.Dict()
+
+
+launch_schema = LaunchSchema()
+"""Schema instance used to serialise the responses of the ``launch`` endpoint."""
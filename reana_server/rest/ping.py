@@ -8,10 +8,21 @@
 
 """Reana-Server Ping-functionality Flask-Blueprint."""
 
-from flask import Blueprint, jsonify
+import json
+
+from flask import Blueprint, Response
 
 blueprint = Blueprint("ping", __name__)
 
+PING_RESPONSE_JSON = (
+    json.dumps({"message": "OK", "status": "200"}, separators=(",", ":")) + "\n"
+).encode()
+"""Serialised body of the ``ping`` endpoint response, which never changes.
+
+It is encoded in the same way as ``jsonify`` does, so that the response bytes
+do not change.
+"""
+
 
 @blueprint.route("/ping", methods=["GET"])
 def ping():  # noqa
@@ -40,5 +51,4 @@ def ping():  # noqa
               message: OK
               status: 200
     """
-
-    return jsonify(message="OK", status="200"), 200
+    return Response(PING_RESPONSE_JSON, status=200, mimetype="application/json")
@@ -44,6 +44,10 @@ class AddSecretsBodySchema(Schema):
     )
 
 
+add_secrets_body_schema = AddSecretsBodySchema(strict=True)
+"""Schema instance used to validate the body of the ``add_secrets`` endpoint."""
+
+
 @blueprint.route("/secrets/", methods=["POST"])
 @signin_required()
 @use_kwargs(
@@ -151,7 +155,7 @@ def add_secrets(user, overwrite=False):
               }
     """
     json_body = request.json
-    AddSecretsBodySchema(strict=True).validate({"body": json_body})
+    add_secrets_body_schema.validate({"body": json_body})
 
     try:
         secrets = [
@@ -278,6 +282,10 @@ class DeleteSecretsBodySchema(Schema):
     body = fields.List(fields.Str(), required=True)
 
 
+delete_secrets_body_schema = DeleteSecretsBodySchema(strict=True)
+"""Schema instance used to validate the body of the ``delete_secrets`` endpoint."""
+
+
 @blueprint.route("/secrets/", methods=["DELETE"])
 @signin_required()
 def delete_secrets(user):  # noqa
@@ -367,7 +375,7 @@ def delete_secrets(user):  # noqa
               }
     """
     json_body = request.json
-    DeleteSecretsBodySchema(strict=True).validate({"body": json_body})
+    delete_secrets_body_schema.validate({"body": json_body})
     secrets = json_body
 
     try:
@@ -9,15 +9,50 @@
 """REANA-Server status functionality Flask-Blueprint."""
 
 import logging
+import threading
+import time
 import traceback
 
 from flask import Blueprint, jsonify
 
+from reana_server.config import REANA_STATUS_CACHE_TTL
 from reana_server.decorators import signin_required
 from reana_server.status import ClusterHealth, ClusterHealthSchema
 
 blueprint = Blueprint("status", __name__)
 
+cluster_health_schema = ClusterHealthSchema()
+"""Schema instance used to serialise the responses of the ``status`` endpoint."""
+
+cluster_health_cache = {"status": None, "expires_at": 0.0}
+"""Last serialised cluster health status and the time at which it expires."""
+
+cluster_health_cache_lock = threading.Lock()
+"""Lock held by the request refreshing the cached cluster health status."""
+
+
+def _compute_cluster_health():
+    """Compute and serialise the current cluster health status."""
+    return cluster_health_schema.dump(ClusterHealth()).data
+
+
+def _get_cluster_health():
+    """Return the serialised cluster health, computing it at most once per TTL."""
+    if REANA_STATUS_CACHE_TTL <= 0:
+        return _compute_cluster_health()
+    if time.monotonic() < cluster_health_cache["expires_at"]:
+        return cluster_health_cache["status"]
+    if not cluster_health_cache_lock.acquire(blocking=False):
+        # another request is refreshing the status, do not wait for it
+        return cluster_health_cache["status"] or _compute_cluster_health()
+    try:
+        status = _compute_cluster_health()
+        cluster_health_cache["status"] = status
+        cluster_health_cache["expires_at"] = time.monotonic() + REANA_STATUS_CACHE_TTL
+        return status
+    finally:
+        cluster_health_cache_lock.release()
+
 
 @blueprint.route("/status")
 @signin_required(token_required=False)
@@ -146,8 +181,11 @@ def status(**kwargs):  # noqa
               }
     """
     try:
-        cluster_health = ClusterHealth()
-        return ClusterHealthSchema().dump(cluster_health)
+        response = jsonify(_get_cluster_health())
+        if REANA_STATUS_CACHE_TTL > 0:
+            response.cache_control.private = True
+            response.cache_control.max_age = REANA_STATUS_CACHE_TTL
+        return response
     except Exception as e:
         logging.error(traceback.format_exc())
         return jsonify({"message": str(e)}), 500
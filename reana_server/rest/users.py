@@ -192,6 +192,9 @@ def get_you(user):
     """
     try:
         if user:
+            # each access to the token properties of the user queries the database
+            active_token = user.active_token
+            latest_token = user.latest_access_token
             return (
                 jsonify(
                     {
@@ -199,12 +202,12 @@ def get_you(user):
                         "email": user.email,
                         "reana_server_version": __version__,
                         "reana_token": {
-                            "value": user.access_token,
-                            "status": user.access_token_status,
+                            "value": active_token.token if active_token else None,
+                            "status": (
+                                latest_token.status.name if latest_token else None
+                            ),
                             "requested_at": (
-                                user.latest_access_token.created
-                                if user.latest_access_token
-                                else None
+                                latest_token.created if latest_token else None
                             ),
                         },
                         "full_name": user.full_name,
@@ -25,10 +25,6 @@ from reana_commons.config import (
     SHARED_VOLUME_PATH,
 )
 from reana_commons.job_utils import kubernetes_memory_to_bytes
-from reana_commons.k8s.api_client import (
-    current_k8s_corev1_api_client,
-    current_k8s_custom_objects_api_client,
-)
 from reana_commons.utils import get_usage_percentage
 from reana_db.database import Session
 from reana_db.models import (
@@ -44,6 +40,10 @@ from reana_db.models import (
 )
 from sqlalchemy import desc
 
+from reana_server.api_client import (
+    current_k8s_corev1_api_client,
+    current_k8s_custom_objects_api_client,
+)
 from reana_server.config import REANA_KUBERNETES_JOBS_MEMORY_LIMIT_IN_BYTES
 
 
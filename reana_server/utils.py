@@ -57,6 +57,7 @@ from sqlalchemy.exc import (
     SQLAlchemyError,
     StatementError,
 )
+from sqlalchemy.orm import selectinload
 
 from reana_server.api_client import current_workflow_submission_publisher
 from reana_server.complexity import (
@@ -296,18 +297,30 @@ def _load_and_save_yadage_spec(workflow: Workflow, operational_options: Dict):
 def _validate_admin_access_token(admin_access_token: str):
     """Validate admin access token."""
     admin = Session.query(User).filter_by(id_=ADMIN_USER_ID).one_or_none()
-    if admin_access_token != admin.access_token:
+    # compare in constant time, so that the token cannot be guessed by timing
+    if not admin_access_token or not secrets.compare_digest(
+        admin_access_token.encode(), (admin.access_token or "").encode()
+    ):
         raise ValueError("Admin access token invalid.")
 
 
-def _get_users(_id, email, user_access_token):
-    """Return all users matching search criteria."""
+def _get_users(_id, email, user_access_token, with_quota_resources=False):
+    """Return all users matching search criteria.
+
+    :param with_quota_resources: Whether to also load the quota resources of the
+        users in bulk, instead of loading them user by user when computing the
+        quota usage.
+    """
     search_criteria = dict()
     if _id:
         search_criteria["id_"] = _id
     if email:
         search_criteria["email"] = email
     query = Session.query(User).filter_by(**search_criteria)
+    if with_quota_resources:
+        query = query.options(
+            selectinload(User.resources).joinedload(UserResource.resource)
+        )
     if user_access_token:
         query = query.join(User.tokens).filter_by(
             token=user_access_token, type_=UserTokenType.reana
@@ -999,3 +999,48 @@ def test_quota_set_default_limits_for_user_with_custom_limits(user0, session):
     )
 
     assert "There are no users without quota limits." in result.output
+
+
+def test_quota_set(user0, session):
+    """Test setting the quota limit of a user."""
+    runner = CliRunner()
+    result = runner.invoke(
+        reana_admin,
+        [
+            "quota-set",
+            "--email",
+            user0.email,
+            "--resource",
+            "disk",
+            "--limit",
+            "12345",
+            "--admin-access-token",
+            user0.access_token,
+        ],
+    )
+    assert result.exit_code == 0
+    assert "successfully set" in result.output
+    assert user0.get_quota_usage()["disk"]["limit"]["raw"] == 12345
+
+
+def test_quota_set_unknown_resource(user0):
+    """Test that an unknown resource is reported before looking up users."""
+    runner = CliRunner()
+    with patch("reana_server.reana_admin.cli._get_user_by_criteria") as get_user:
+        result = runner.invoke(
+            reana_admin,
+            [
+                "quota-set",
+                "--email",
+                user0.email,
+                "--resource",
+                "unknown",
+                "--limit",
+                "12345",
+                "--admin-access-token",
+                user0.access_token,
+            ],
+        )
+        get_user.assert_not_called()
+    assert result.exit_code == 1
+    assert "Provided resource `unknown` does not exist" in result.output
@@ -8,9 +8,21 @@
 
 """Test factory app."""
 
+from flask import Flask
+
+from reana_server.ext import REANA
 from reana_server.factory import create_minimal_app
 
 
 def test_create_app():
     """Test create_minimal_app() method."""
     create_minimal_app()
+
+
+def test_json_keys_not_sorted():
+    """Test JSON responses keep the order of their keys."""
+    reana_app = Flask(__name__)
+    REANA(reana_app)
+    minimal_app = create_minimal_app()
+    for app in (reana_app, minimal_app):
+        assert app.json.dumps({"b": 1, "a": 2}) == '{"b": 1, "a": 2}'
@@ -8,13 +8,20 @@
 """REANA-Server GitLab client tests."""
 
 import unittest.mock as mock
+from http.client import HTTPMessage
 from uuid import uuid4
 
 import pytest
+import requests
 from reana_commons.k8s.secrets import UserSecrets, Secret
+from requests.cookies import MockRequest, MockResponse, RequestsCookieJar
 
 import reana_server.config as config
-from reana_server.gitlab_client import GitLabClient, GitLabClientInvalidToken
+from reana_server.gitlab_client import (
+    GitLabClient,
+    GitLabClientInvalidToken,
+    gitlab_session,
+)
 
 
 def mock_response(status_code=200, json={}, content=b"", links={}):
@@ -266,3 +273,19 @@ def test_gitlab_client_get_user():
 
     res = gitlab_client.get_user()
     assert res is response
+
+
+def test_gitlab_client_session_without_cookies():
+    client = GitLabClient(access_token="gitlab_token", host="gitlab.example.org")
+    assert client._http_request == gitlab_session.request
+
+    headers = HTTPMessage()
+    headers["Set-Cookie"] = "_gitlab_session=abc; Path=/"
+    request = MockRequest(
+        requests.Request("GET", "https://gitlab.example.org/api/v4/user").prepare()
+    )
+    cookies = RequestsCookieJar()
+    cookies.extract_cookies(MockResponse(headers), request)
+    assert cookies
+    gitlab_session.cookies.extract_cookies(MockResponse(headers), request)
+    assert not gitlab_session.cookies
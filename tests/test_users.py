@@ -15,6 +15,21 @@ from mock import patch
 from pytest_reana.test_utils import make_mock_api_client
 
 
+def test_get_you(app, user0):
+    """Test getting information about yourself."""
+    with app.test_client() as client:
+        response = client.get(
+            url_for("users.get_you"),
+            query_string={"access_token": user0.access_token},
+        )
+
+        assert response.status_code == 200
+        assert response.json["email"] == user0.email
+        assert response.json["reana_token"]["value"] == user0.access_token
+        assert response.json["reana_token"]["status"] == "active"
+        assert response.json["reana_token"]["requested_at"]
+
+
 def test_get_users_shared_with_you(app, user1):
     """Test getting users who shared workflows with you."""
     with app.test_client() as client:
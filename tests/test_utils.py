@@ -7,11 +7,18 @@
 """REANA-Server tests for utils module."""
 
 import pathlib
+from unittest.mock import patch
 
 import pytest
 from reana_commons.errors import REANAValidationError
 from reana_db.models import UserToken, UserTokenStatus, UserTokenType
-from reana_server.utils import filter_input_files, get_user_from_token, is_valid_email
+from reana_server.utils import (
+    _get_users,
+    _validate_admin_access_token,
+    filter_input_files,
+    get_user_from_token,
+    is_valid_email,
+)
 
 
 @pytest.mark.parametrize(
@@ -49,6 +56,30 @@ def test_filter_input_files(tmp_path: pathlib.Path):
     assert len(list(tmp_path.iterdir())) == 1
 
 
+@pytest.mark.parametrize("token", [None, "", "user0tokem", "user0token0", "tökën"])
+def test_validate_admin_access_token_invalid(user0, token):
+    with pytest.raises(ValueError, match="Admin access token invalid"):
+        _validate_admin_access_token(token)
+
+
+def test_validate_admin_access_token(user0):
+    _validate_admin_access_token(user0.access_token)
+
+
+def test_get_users_with_quota_resources(user0, session):
+    email = user0.email
+    quota_usage = user0.get_quota_usage()
+    session.expire_all()
+
+    (user,) = _get_users(None, email, None)
+    assert "resources" not in user.__dict__
+    session.expire_all()
+
+    (user,) = _get_users(None, email, None, with_quota_resources=True)
+    assert "resources" in user.__dict__
+    assert user.get_quota_usage() == quota_usage
+
+
 def test_get_user_from_token(user0):
     """Test getting user from his own token."""
     assert user0.id_ == get_user_from_token(user0.access_token).id_
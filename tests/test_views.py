@@ -11,17 +11,27 @@
 import copy
 import json
 import logging
+import os
+import shutil
+import zipfile
+from importlib.metadata import PackageNotFoundError
 from io import BytesIO
+from urllib.request import urlretrieve
 from uuid import uuid4
 
 import pytest
+import yaml
 from flask import Flask, url_for
 from mock import Mock, patch
 from pytest_reana.test_utils import make_mock_api_client
 
 from reana_db.models import User, InteractiveSessionType, RunStatus
 from reana_commons.k8s.secrets import UserSecrets, Secret
+from reana_commons.specification import load_reana_spec
 
+from reana_server.fetcher import get_fetcher
+from reana_server.rest.info import InfoSchema, _get_cluster_information
+from reana_server.rest.launch import _load_workflow_specification
 from reana_server.utils import (
     _create_and_associate_local_user,
     _create_and_associate_oauth_user,
@@ -881,3 +891,333 @@ def test_gitlab_projects(app: Flask, user0):
         assert res.json["items"][0]["url"] == "url"
         assert res.json["items"][0]["path"] == "abcd"
         assert res.json["items"][0]["hook_id"] == 456
+
+
+def test_info(app, user0):
+    """Test info view."""
+    with app.test_client() as client:
+        res = client.get(
+            url_for("info.info"), query_string={"access_token": user0.access_token}
+        )
+        assert res.status_code == 200
+        assert res.json["supported_workflow_engines"]["value"] == [
+            "cwl",
+            "serial",
+            "snakemake",
+            "yadage",
+        ]
+        etag = res.headers["ETag"]
+        assert etag
+
+        res = client.get(
+            url_for("info.info"),
+            query_string={"access_token": user0.access_token},
+            headers={"If-None-Match": etag},
+        )
+        assert res.status_code == 304
+        assert not res.data
+
+
+def test_info_missing_engine_package():
+    """Test info reports a null version for engine packages that are missing."""
+    with patch("reana_server.rest.info.version", side_effect=PackageNotFoundError):
+        cluster_information = InfoSchema().dump(_get_cluster_information()).data
+    engine_versions = [
+        "cwl_engine_version",
+        "yadage_engine_version",
+        "yadage_engine_adage_version",
+        "yadage_engine_packtivity_version",
+        "snakemake_engine_version",
+    ]
+    errors = InfoSchema().load(cluster_information).errors
+    for engine_version in engine_versions:
+        assert cluster_information[engine_version]["value"] is None
+        assert engine_version not in errors
+
+
+@pytest.mark.parametrize("parameters", ["not json", "[1, 2]"])
+def test_launch_invalid_parameters(app, user0, parameters):
+    """Test launch view with parameters that are not a JSON object."""
+    with app.test_client() as client:
+        with patch("reana_server.rest.launch.get_fetcher") as get_fetcher:
+            res = client.post(
+                url_for("launch.launch"),
+                query_string={"access_token": user0.access_token},
+                json={
+                    "url": "https://github.com/reanahub/reana-demo-root6-roofit",
+                    "parameters": parameters,
+                },
+            )
+            assert res.status_code == 422
+            get_fetcher.assert_not_called()
+
+
+def test_ping(app):
+    """Test ping view."""
+    with app.test_client() as client:
+        res = client.get(url_for("ping.ping"))
+        assert res.status_code == 200
+        assert res.data == b'{"message":"OK","status":"200"}\n'
+
+
+def test_launch_without_parameters(app, user0):
+    """Test that launch view does not require workflow parameters."""
+    with app.test_client() as client:
+        with patch("reana_server.rest.launch.get_fetcher") as get_fetcher:
+            get_fetcher.side_effect = Exception("Fetching failed")
+            res = client.post(
+                url_for("launch.launch"),
+                query_string={"access_token": user0.access_token},
+                json={"url": "https://github.com/reanahub/reana-demo-root6-roofit"},
+            )
+            assert res.status_code == 500
+            get_fetcher.assert_called_once()
+            # the directory where the workflow is fetched is removed
+            _, tmpdir, _ = get_fetcher.call_args.args
+            assert not os.path.exists(tmpdir)
+
+
+def test_launch_invalid_name(app, user0):
+    """Test launch view with an invalid workflow name."""
+    with app.test_client() as client:
+        with patch("reana_server.rest.launch.get_fetcher") as get_fetcher:
+            res = client.post(
+                url_for("launch.launch"),
+                query_string={"access_token": user0.access_token},
+                json={
+                    "url": "https://github.com/reanahub/reana-demo-root6-roofit",
+                    "name": "invalid.name",
+                },
+            )
+            assert res.status_code == 400
+            get_fetcher.assert_not_called()
+
+
+def test_status_cached(app, user0):
+    """Test status view serves the cluster health from cache."""
+    cluster_health = Mock(node={}, job={}, workflow={}, session={"active": 1})
+    with app.test_client() as client:
+        with patch(
+            "reana_server.rest.status.ClusterHealth", return_value=cluster_health
+        ) as cluster_health_mock, patch.dict(
+            "reana_server.rest.status.cluster_health_cache",
+            {"status": None, "expires_at": 0.0},
+        ):
+            for _ in range(2):
+                res = client.get(
+                    url_for("status.status"),
+                    query_string={"access_token": user0.access_token},
+                )
+                assert res.status_code == 200
+                assert res.json["session"] == {"active": 1}
+                assert res.cache_control.max_age == 5
+            cluster_health_mock.assert_called_once()
+
+
+def test_status_not_cached(app, user0):
+    """Test status view computes the cluster health on every request if TTL is 0."""
+    cluster_health = Mock(node={}, job={}, workflow={}, session={"active": 1})
+    with app.test_client() as client:
+        with patch(
+            "reana_server.rest.status.ClusterHealth", return_value=cluster_health
+        ) as cluster_health_mock, patch(
+            "reana_server.rest.status.REANA_STATUS_CACHE_TTL", 0
+        ), patch(
+            "reana_server.rest.status.cluster_health_cache_lock"
+        ) as lock_mock:
+            for _ in range(2):
+                res = client.get(
+                    url_for("status.status"),
+                    query_string={"access_token": user0.access_token},
+                )
+                assert res.status_code == 200
+                assert res.json["session"] == {"active": 1}
+                assert "Cache-Control" not in res.headers
+            assert cluster_health_mock.call_count == 2
+            lock_mock.acquire.assert_not_called()
+
+
+def test_status_refresh_in_progress(app, user0):
+    """Test status view does not wait for another request refreshing the status."""
+    stale_status = {"node": {}, "job": {}, "workflow": {}, "session": {"active": 2}}
+    with app.test_client() as client:
+        with patch("reana_server.rest.status.ClusterHealth") as cluster_health_mock:
+            with patch.dict(
+                "reana_server.rest.status.cluster_health_cache",
+                {"status": stale_status, "expires_at": 0.0},
+            ), patch("reana_server.rest.status.cluster_health_cache_lock") as lock_mock:
+                lock_mock.acquire.return_value = False
+                res = client.get(
+                    url_for("status.status"),
+                    query_string={"access_token": user0.access_token},
+                )
+                assert res.status_code == 200
+                assert res.json["session"] == {"active": 2}
+                cluster_health_mock.assert_not_called()
+
+
+SERIAL_REANA_YAML = """
+inputs:
+  files:
+    - code/hello.py
+  parameters:
+    name: world
+workflow:
+  type: serial
+  specification:
+    steps:
+      - environment: docker.io/library/python:3.12
+        commands:
+          - python code/hello.py --name ${name}
+"""
+
+YADAGE_REANA_YAML = """
+inputs:
+  parameters:
+    name: world
+workflow:
+  type: yadage
+  file: workflow.yaml
+"""
+
+YADAGE_WORKFLOW_YAML = """
+stages:
+  - name: hello
+    dependencies: [init]
+    scheduler:
+      scheduler_type: singlestep-stage
+      parameters:
+        name: {step: init, output: name}
+      step:
+        process:
+          process_type: interpolated-script-cmd
+          script: echo {name}
+        environment:
+          environment_type: docker-encapsulated
+          image: docker.io/library/python
+          imagetag: "3.12"
+        publisher:
+          publisher_type: interpolated-pub
+          publish: {}
+"""
+
+CWL_REANA_YAML = """
+inputs:
+  parameters:
+    input: inputs.yaml
+workflow:
+  type: cwl
+  file: workflow.cwl
+"""
+
+CWL_WORKFLOW = """
+cwlVersion: v1.0
+class: CommandLineTool
+baseCommand: echo
+inputs:
+  message:
+    type: string
+    inputBinding:
+      position: 1
+outputs: []
+"""
+
+
+@pytest.mark.parametrize(
+    "files",
+    [
+        {"reana.yaml": SERIAL_REANA_YAML, "code/hello.py": "print('Hello')"},
+        {"reana.yaml": YADAGE_REANA_YAML, "workflow.yaml": YADAGE_WORKFLOW_YAML},
+        pytest.param(
+            {
+                "reana.yaml": CWL_REANA_YAML,
+                "workflow.cwl": CWL_WORKFLOW,
+                "inputs.yaml": "message: world",
+            },
+            marks=pytest.mark.skipif(
+                not shutil.which("cwltool"), reason="cwltool is not installed"
+            ),
+        ),
+    ],
+)
+@patch("reana_server.fetcher.FETCHER_ALLOWED_SCHEMES", ["file"])
+def test_load_workflow_specification(files, tmp_path):
+    """Test loading a fetched specification in the same way as reana-commons."""
+    archive_path = tmp_path / "workflow.zip"
+    with zipfile.ZipFile(archive_path, "w") as zip_file:
+        for file_name, content in files.items():
+            zip_file.writestr(file_name, content)
+    fetch_dir = tmp_path / "fetched"
+    fetch_dir.mkdir()
+
+    with patch(
+        "reana_server.fetcher.WorkflowFetcherBase._download_file",
+        side_effect=urlretrieve,
+    ):
+        fetcher = get_fetcher(f"file://{archive_path}", str(fetch_dir), None)
+        fetcher.fetch()
+    spec_path = fetcher.workflow_spec_path()
+
+    with open(spec_path) as spec_fd:
+        reana_yaml = yaml.safe_load(spec_fd)
+    _load_workflow_specification(reana_yaml, workspace_path=str(fetch_dir))
+    assert reana_yaml == load_reana_spec(spec_path, workspace_path=str(fetch_dir))
+
+
+def test_launch(app, user0, sample_serial_workflow_in_db):
+    """Test launch view submits the fetched workflow."""
+    workflow = sample_serial_workflow_in_db
+
+    def get_fetcher_mock(url, tmpdir, specification):
+        def fetch():
+            os.makedirs(os.path.join(tmpdir, "code"))
+            with open(os.path.join(tmpdir, "code", "hello.py"), "w") as f:
+                f.write("print('Hello')")
+            with open(os.path.join(tmpdir, "reana.yaml"), "w") as f:
+                f.write(SERIAL_REANA_YAML)
+
+        return Mock(
+            fetch=Mock(side_effect=fetch),
+            workflow_spec_path=Mock(return_value=os.path.join(tmpdir, "reana.yaml")),
+        )
+
+    rwc_api_client = Mock()
+    rwc_api_client.api.create_workflow.return_value.result.return_value = (
+        {"workflow_id": str(workflow.id_)},
+        Mock(),
+    )
+    with app.test_client() as client:
+        with patch(
+            "reana_server.rest.launch.get_fetcher", side_effect=get_fetcher_mock
+        ), patch(
+            "reana_server.rest.launch.current_rwc_api_client", rwc_api_client
+        ), patch(
+            "reana_server.rest.launch.publish_workflow_submission"
+        ) as publish_workflow_submission:
+            res = client.post(
+                url_for("launch.launch"),
+                query_string={"access_token": user0.access_token},
+                json={
+                    "url": "https://github.com/reanahub/reana-demo-helloworld",
+                    "name": "hello",
+                    "parameters": json.dumps({"name": "REANA"}),
+                },
+            )
+            assert res.status_code == 200
+            assert res.json["workflow_id"] == str(workflow.id_)
+            assert res.json["workflow_name"] == workflow.name
+
+            workflow_dict = rwc_api_client.api.create_workflow.call_args.kwargs[
+                "workflow"
+            ]
+            assert workflow_dict["workflow_name"] == "hello"
+            reana_specification = workflow_dict["reana_specification"]
+            assert reana_specification["workflow"]["specification"]["steps"]
+            publish_workflow_submission.assert_called_once_with(
+                workflow,
+                user0.id_,
+                {"input_parameters": {"name": "REANA"}},
+            )
+            assert os.path.isfile(
+                os.path.join(workflow.workspace_path, "code", "hello.py")
+            )